@@ -49,6 +49,8 @@ def _ai_trace_log_response(
     duration_ms: Optional[int] = None,
     error: Optional[str] = None,
 ) -> None:
+    if not _ai_trace_enabled():
+        return
     lines: List[str] = []
     header = f"AI_RESP call_id={call_id} model={model}"
     if duration_ms is not None:
@@ -1,7 +1,6 @@
 import base64
-import json
-import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Tuple
 
 from llm_client import get_default_model, get_llm_client, resolve_model
@@ -14,7 +13,63 @@ from ai_trace import (
 )
 from runtime import _log
 from profile_utils import _get_core
-from text_utils import normalize_dashes
+from text_utils import loads_json, normalize_dashes
+
+
+_CORE_FIELDS = (
+    "Name",
+    "Gender",
+    "Sexuality",
+    "Age",
+    "Height",
+    "Location",
+    "Explicit Ethnicity",
+    "Children",
+    "Family plans",
+    "Covid Vaccine",
+    "Pets",
+    "Zodiac Sign",
+    "Job title",
+    "University",
+    "Religious Beliefs",
+    "Home town",
+    "Politics",
+    "Languages spoken",
+    "Dating Intentions",
+    "Relationship type",
+    "Drinking",
+    "Smoking",
+    "Marijuana",
+    "Drugs",
+)
+_EMPTY_CORE: Dict[str, Any] = dict.fromkeys(_CORE_FIELDS, "")
+
+_VISUAL_KEYS = (
+    "Face Visibility Quality",
+    "Photo Authenticity / Editing Level",
+    "Apparent Body Fat Level",
+    "Profile Distinctiveness",
+    "Apparent Build Category",
+    "Apparent Skin Tone",
+    "Apparent Ethnic Features",
+    "Hair Color",
+    "Facial Symmetry Level",
+    "Indicators of Fitness or Lifestyle",
+    "Overall Visual Appeal Vibe",
+    "Apparent Age Range Category",
+    "Attire and Style Indicators",
+    "Body Language and Expression",
+    "Visible Enhancements or Features",
+    "Apparent Chest Proportions",
+    "Apparent Attractiveness Tier",
+    "Reasoning for attractiveness tier",
+    "Facial Proportion Balance",
+    "Grooming Effort Level",
+    "Presentation Red Flags",
+    "Visible Tattoo Level",
+    "Visible Piercing Level",
+    "Short-Term / Hookup Orientation Signals",
+)
 
 
 def _b64_image(image_path: str) -> str:
@@ -30,14 +85,21 @@ def build_llm_batch_payload(
     if not prompt:
         prompt = LLM1_VISUAL()
 
-    existing = [p for p in screenshots if isinstance(p, str) and os.path.exists(p)]
-
     if format == "openai_messages":
         content_parts = [{"type": "text", "text": prompt}]
-        for p in existing:
+        existing: List[str] = []
+        for p in screenshots:
+            if not isinstance(p, str) or not p:
+                continue
+            # Missing files surface as OSError from the read; no separate exists() stat.
+            try:
+                url = f"data:image/png;base64,{_b64_image(p)}"
+            except OSError:
+                continue
+            existing.append(p)
             content_parts.append({
                 "type": "image_url",
-                "image_url": {"url": f"data:image/png;base64,{_b64_image(p)}"},
+                "image_url": {"url": url},
             })
         return {
             "format": "openai_messages",
@@ -94,7 +156,7 @@ def run_profile_eval_llm(extracted: Dict[str, Any], model: str | None = None) ->
         dt_ms = int((time.perf_counter() - t0) * 1000)
         raw = resp.choices[0].message.content or ""
         try:
-            parsed = json.loads(raw or "{}")
+            parsed = loads_json(raw)
         except Exception as e:
             _ai_trace_log_response(
                 "profile_eval_llm",
@@ -161,7 +223,7 @@ def run_llm1_visual(
         dt_ms = int((time.perf_counter() - t0) * 1000)
         raw = resp.choices[0].message.content or ""
         try:
-            parsed = json.loads(raw or "{}")
+            parsed = loads_json(raw)
         except Exception as e:
             _ai_trace_log_response(
                 "llm1_visual",
@@ -204,45 +266,43 @@ def run_llm1_visual(
         return {}, payload.get("meta", {})
 
 
+def run_llm1_and_profile_eval(
+    biometrics: Dict[str, Any],
+    ui_map: Dict[str, Any],
+    image_paths: List[str],
+    model: str | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Run LLM1 (visual) and LLM2 (profile eval) concurrently.
+    LLM2 only reads core biometrics, which do not depend on LLM1 output.
+    Returns (extracted, llm1_meta, eval_result).
+    """
+    try:
+        get_llm_client()  # build the cached client once before the workers share it
+    except Exception:
+        pass  # each call logs its own client error
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        llm1_future = pool.submit(run_llm1_visual, image_paths, model=model)
+        eval_future = pool.submit(
+            run_profile_eval_llm,
+            _build_extracted_profile(biometrics, ui_map, {}),
+            model=model,
+        )
+        llm1_result, llm1_meta = llm1_future.result()
+        eval_result = eval_future.result()
+    extracted = _build_extracted_profile(biometrics, ui_map, llm1_result)
+    return extracted, llm1_meta, eval_result
+
+
 def _build_extracted_profile(
     biometrics: Dict[str, Any],
     ui_map: Dict[str, Any],
     llm1_visual: Dict[str, Any],
 ) -> Dict[str, Any]:
-    core_fields = [
-        "Name",
-        "Gender",
-        "Sexuality",
-        "Age",
-        "Height",
-        "Location",
-        "Explicit Ethnicity",
-        "Children",
-        "Family plans",
-        "Covid Vaccine",
-        "Pets",
-        "Zodiac Sign",
-        "Job title",
-        "University",
-        "Religious Beliefs",
-        "Home town",
-        "Politics",
-        "Languages spoken",
-        "Dating Intentions",
-        "Relationship type",
-        "Drinking",
-        "Smoking",
-        "Marijuana",
-        "Drugs",
-    ]
-    core: Dict[str, Any] = {k: "" for k in core_fields}
+    core: Dict[str, Any] = _EMPTY_CORE.copy()
     core["Age"] = None
     core["Height"] = None
-    for k, v in biometrics.items():
-        if k in {"Age", "Height"}:
-            core[k] = v
-        elif k in core:
-            core[k] = v
+    core.update((k, v) for k, v in biometrics.items() if k in core)
 
     # Prompts
     prompts_out: List[Dict[str, Any]] = []
@@ -294,14 +354,13 @@ def _build_extracted_profile(
     if not isinstance(visual_traits, dict):
         visual_traits = {}
 
+    photos_by_id: Dict[str, Dict[str, Any]] = {}
+    for p in ui_map.get("photos", []) or []:
+        photos_by_id.setdefault(p.get("id"), p)
     photo_entries: List[Dict[str, Any]] = []
     for idx in range(1, 7):
         pid = f"photo_{idx}"
-        photo_meta = None
-        for p in ui_map.get("photos", []):
-            if p.get("id") == pid:
-                photo_meta = p
-                break
+        photo_meta = photos_by_id.get(pid)
         photo_entries.append(
             {
                 "id": pid,
@@ -312,33 +371,7 @@ def _build_extracted_profile(
         )
 
     # Ensure all visual trait keys exist.
-    visual_keys = [
-        "Face Visibility Quality",
-        "Photo Authenticity / Editing Level",
-        "Apparent Body Fat Level",
-        "Profile Distinctiveness",
-        "Apparent Build Category",
-        "Apparent Skin Tone",
-        "Apparent Ethnic Features",
-        "Hair Color",
-        "Facial Symmetry Level",
-        "Indicators of Fitness or Lifestyle",
-        "Overall Visual Appeal Vibe",
-        "Apparent Age Range Category",
-        "Attire and Style Indicators",
-        "Body Language and Expression",
-        "Visible Enhancements or Features",
-        "Apparent Chest Proportions",
-        "Apparent Attractiveness Tier",
-        "Reasoning for attractiveness tier",
-        "Facial Proportion Balance",
-        "Grooming Effort Level",
-        "Presentation Red Flags",
-        "Visible Tattoo Level",
-        "Visible Piercing Level",
-        "Short-Term / Hookup Orientation Signals",
-    ]
-    visual_out = {k: visual_traits.get(k, "") for k in visual_keys}
+    visual_out = {k: visual_traits.get(k, "") for k in _VISUAL_KEYS}
 
     return {
         "Core Biometrics (Objective)": core,
@@ -1,6 +1,17 @@
 from ppadb.client import Client as AdbClient
+import struct
 import subprocess
 import time
+from typing import Dict, Optional, Tuple
+
+
+_RESOLUTION_CACHE: Dict[str, Tuple[int, int]] = {}
+_SHELL_SESSIONS: Dict[str, "_ShellSession"] = {}
+_USB_TRANSPORT_CACHE: Dict[str, bool] = {}
+
+_SHELL_DONE = b"__HINGE_DONE__"
+# Written with an empty quote pair so the pty echo of the command never matches _SHELL_DONE.
+_SHELL_DONE_CMD = 'echo __HINGE_""DONE__'
 
 
 def ensure_adb_running():
@@ -31,40 +42,187 @@ def connect_device(user_ip_address: str = "127.0.0.1"):
     return device
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def screencap_png(device) -> bytes:
+    """
+    PNG screencap over the adb exec service: raw bytes, no pty CRLF translation
+    or fix-up copy. Falls back to ppadb's shell-based screencap.
+    """
+    try:
+        conn = device.create_connection()
+        with conn:
+            conn.send("exec:screencap -p")
+            data = conn.read_all()
+        if data[:8] == _PNG_SIGNATURE:
+            return bytes(data)
+    except Exception:
+        pass
+    return device.screencap()
+
+
+def is_usb_transport(device) -> bool:
+    """
+    True when adb reports a USB device path ("usb:...") for the device. TCP and
+    wireless-debugging (mDNS) transports report "unknown", as can USB on hosts
+    where adb exposes no device path.
+    """
+    serial = getattr(device, "serial", "")
+    if serial not in _USB_TRANSPORT_CACHE:
+        try:
+            devpath = device.get_device_path() or ""
+        except Exception:
+            devpath = ""
+        _USB_TRANSPORT_CACHE[serial] = devpath.strip().startswith("usb:")
+    return _USB_TRANSPORT_CACHE[serial]
+
+
+_RGBA_8888 = 1
+
+
+def screencap_raw(device) -> Optional[Tuple[int, int, memoryview]]:
+    """
+    Uncompressed screencap over the adb exec service, skipping the on-device PNG
+    encode. Returns (width, height, rgba_pixels), or None for non-RGBA_8888 frames.
+    """
+    conn = device.create_connection()
+    with conn:
+        conn.send("exec:screencap")
+        data = conn.read_all()
+    if len(data) < 12:
+        return None
+    width, height, fmt = struct.unpack_from("<III", data)
+    # Header is width/height/format, plus a colorspace word on newer Android releases.
+    header = len(data) - width * height * 4
+    if fmt != _RGBA_8888 or header not in (12, 16):
+        return None
+    return width, height, memoryview(data)[header:]
+
+
+class _ShellSession:
+    """
+    One long-lived interactive adb shell per device. Commands are written to the
+    open socket and completion is detected by an echoed marker, so input
+    commands skip opening a new adb transport connection each time.
+    """
+
+    def __init__(self, device, timeout_s: float = 15.0) -> None:
+        self._conn = device.create_connection()
+        self._conn.send("shell:")
+        self._sock = self._conn.socket
+        self._sock.settimeout(timeout_s)
+
+    def send(self, cmd: str) -> None:
+        self._sock.sendall(f"{cmd}; {_SHELL_DONE_CMD}\n".encode("utf-8"))
+
+    def wait(self) -> None:
+        buf = b""
+        while _SHELL_DONE not in buf:
+            chunk = self._sock.recv(4096)
+            if not chunk:
+                raise ConnectionError("adb shell session closed")
+            buf = buf[-len(_SHELL_DONE):] + chunk
+
+    def close(self) -> None:
+        try:
+            self._conn.close()
+        except Exception:
+            pass
+
+
+def _drop_shell_session(serial: str) -> None:
+    session = _SHELL_SESSIONS.pop(serial, None)
+    if session is not None:
+        session.close()
+
+
+def _input_shell(device, cmd: str) -> None:
+    """
+    Run a fire-and-wait command (input, app launch) over the device's persistent shell.
+    Falls back to device.shell() only if the command was never sent, so a
+    failure after sending cannot replay a tap.
+    """
+    serial = getattr(device, "serial", "")
+    try:
+        session = _SHELL_SESSIONS.get(serial)
+        if session is None:
+            session = _ShellSession(device)
+            _SHELL_SESSIONS[serial] = session
+        session.send(cmd)
+    except Exception:
+        _drop_shell_session(serial)
+        device.shell(cmd)
+        return
+    try:
+        session.wait()
+    except Exception as e:
+        print(f"[ADB] persistent shell lost after send: {e}")
+        _drop_shell_session(serial)
+
+
 def tap(device, x: int, y: int) -> None:
-    device.shell(f"input tap {x} {y}")
+    _input_shell(device, f"input tap {x} {y}")
 
 
 def swipe(device, x1: int, y1: int, x2: int, y2: int, duration: int = 500) -> None:
-    device.shell(f"input swipe {x1} {y1} {x2} {y2} {duration}")
+    _input_shell(device, f"input swipe {x1} {y1} {x2} {y2} {duration}")
+
+
+_WHITESPACE_TO_SPACE = str.maketrans("\n\r\t", "   ")
+_SPACE_TO_ADB = str.maketrans({" ": "%s"})
+
+
+def _prepare_input_text(text: str) -> str:
+    s = text.translate(_WHITESPACE_TO_SPACE).strip().translate(_SPACE_TO_ADB)
+    return _shell_quote(s)
 
 
 def input_text(device, text: str) -> None:
     if not text:
         return
-    s = text.replace("\n", " ").replace("\r", " ").replace("\t", " ").strip()
-    s = s.replace(" ", "%s")
-    s = _shell_quote(s)
-    device.shell(f"input text {s}")
+    _input_shell(device, f"input text {_prepare_input_text(text)}")
+
+
+def input_text_and_hide_keyboard(device, text: str, settle_s: float = 0.2) -> None:
+    """
+    Type text and dismiss the keyboard in one shell round-trip; the settle
+    pause between them runs on-device.
+    """
+    if not text:
+        hide_keyboard(device)
+        return
+    _input_shell(device, f"input text {_prepare_input_text(text)}; sleep {settle_s}; input keyevent 4")
 
 
 def _shell_quote(text: str) -> str:
     return "'" + text.replace("'", "'\"'\"'") + "'"
 
 
+def tap_and_hide_keyboard(device, x: int, y: int, settle_s: float = 0.3) -> None:
+    """
+    Tap, wait on-device, then dismiss the keyboard in one shell round-trip.
+    """
+    _input_shell(device, f"input tap {x} {y}; sleep {settle_s}; input keyevent 4")
+
+
 def hide_keyboard(device) -> None:
-    device.shell("input keyevent 4")
+    _input_shell(device, "input keyevent 4")
 
 
 def get_screen_resolution(device):
+    serial = getattr(device, "serial", "")
+    if serial in _RESOLUTION_CACHE:
+        return _RESOLUTION_CACHE[serial]
     output = device.shell("wm size")
     resolution = output.strip().split(":")[1].strip()
     width, height = map(int, resolution.split("x"))
+    _RESOLUTION_CACHE[serial] = (width, height)
     return width, height
 
 
 def open_hinge(device) -> None:
-    device.shell("monkey -p co.hinge.app 1")
+    _input_shell(device, "monkey -p co.hinge.app 1")
     time.sleep(1)
 
 
@@ -1,13 +1,9 @@
 import os
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from types import SimpleNamespace
 
-from openai import OpenAI
-
-try:
-    from google import genai
-except Exception:
-    genai = None
+if TYPE_CHECKING:
+    from openai import OpenAI
 
 
 _CLIENT_CACHE: Dict[Tuple[Any, ...], Any] = {}
@@ -65,16 +61,22 @@ def get_llm_client() -> Any:
     return _get_openai_client()
 
 
-def _get_openai_client() -> OpenAI:
+# Provider SDKs are imported on first client creation so startup only pays for
+# the one in use (google-genai alone takes about a second to import).
+def _get_openai_client() -> "OpenAI":
     api_key = os.getenv("OPENAI_API_KEY")
     cache_key = ("openai", api_key)
     if cache_key not in _CLIENT_CACHE:
+        from openai import OpenAI
+
         _CLIENT_CACHE[cache_key] = OpenAI(api_key=api_key)
     return _CLIENT_CACHE[cache_key]
 
 
 def _get_gemini_client() -> Any:
-    if genai is None:
+    try:
+        from google import genai
+    except Exception:
         raise RuntimeError("google-genai is required for GEMINI usage.")
     use_vertex = _env_bool("GEMINI_USE_VERTEX", default=False)
     project_id = (os.getenv("GEMINI_PROJECT_ID") or os.getenv("GOOGLE_CLOUD_PROJECT") or "").strip()
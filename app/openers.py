@@ -1,4 +1,3 @@
-import json
 import time
 from typing import Any, Dict
 
@@ -6,6 +5,7 @@ from llm_client import get_default_model, get_llm_client, resolve_model
 from prompts import LLM3_LONG, LLM3_SHORT, LLM4
 from ai_trace import _ai_trace_log, _ai_trace_log_response, _ai_trace_prompt_lines
 from runtime import _log
+from text_utils import loads_json
 
 def run_llm3_long(extracted: Dict[str, Any], model: str | None = None) -> Dict[str, Any]:
     prompt = LLM3_LONG(extracted)
@@ -26,7 +26,7 @@ def run_llm3_long(extracted: Dict[str, Any], model: str | None = None) -> Dict[s
         dt_ms = int((time.perf_counter() - t0) * 1000)
         raw = resp.choices[0].message.content or ""
         try:
-            parsed = json.loads(raw or "{}")
+            parsed = loads_json(raw)
         except Exception as e:
             _ai_trace_log_response(
                 "llm3_long",
@@ -87,7 +87,7 @@ def run_llm3_short(extracted: Dict[str, Any], model: str | None = None) -> Dict[
         dt_ms = int((time.perf_counter() - t0) * 1000)
         raw = resp.choices[0].message.content or ""
         try:
-            parsed = json.loads(raw or "{}")
+            parsed = loads_json(raw)
         except Exception as e:
             _ai_trace_log_response(
                 "llm3_short",
@@ -148,7 +148,7 @@ def run_llm4(openers_json: Dict[str, Any], model: str | None = None) -> Dict[str
         dt_ms = int((time.perf_counter() - t0) * 1000)
         raw = resp.choices[0].message.content or ""
         try:
-            parsed = json.loads(raw or "{}")
+            parsed = loads_json(raw)
         except Exception as e:
             _ai_trace_log_response(
                 "llm4",
@@ -85,66 +85,74 @@ def LLM1_VISUAL() -> str:
 
 
 
+# Static parts of the LLM2 prompt, joined once at import.
+_LLM2_HEAD = "".join([
+    "You are enriching structured dating profile fields for a scoring system. Use ONLY the provided text. Do not browse. Be conservative when uncertain, but apply a slight optimistic bias when inferring future earning potential.\n\n",
+    "INPUT FIELDS (from the extracted JSON):\n",
+    '- "Home town" (string; may be city/region/country or empty)\n',
+    '- "Job title" (string; may be empty)\n',
+    '- "University" (string; may be empty)\n\n',
+    "VALUES:\n",
+])
+_LLM2_TAIL = "".join([
+    "YOUR TASKS (3):\n",
+    '1) Resolve "Home town" to an ISO 3166-1 alpha-2 country code (uppercase). If it is a UK city/area (e.g., "Wembley", "Harrow", "Manchester"), return "GB".\n',
+    '2) Estimate FUTURE EARNING POTENTIAL (TIER) from the vague job/study field AND the university context. Titles are often minimal (e.g., "Tech", "Finance", "Product", "Student", "PhD"). Use the tier table in section B and return the corresponding band "T0"-"T4". When uncertain between two adjacent tiers, be slightly optimistic and choose the higher tier by at most one step.\n',
+    '3) Check if "University" matches an elite list (case-insensitive), and return a 1/0 flag and the matched canonical name.\n\n',
+    "--------------------------------------------------------------------------------\n",
+    "A) home_country_iso\n",
+    '- If unresolved: home_country_iso = "" and home_country_confidence = 0.0.\n\n',
+    "B) FUTURE EARNING POTENTIAL (tiers T0-T4) -> job.band\n",
+    "- Goal: infer likely earning trajectory within ~10 years using BOTH job/study field and university context (if visible). Classify into one of these tiers:\n",
+    "  T0: Low/no trajectory. Clear low-mobility sectors with low ceiling and no elite cues: retail, hospitality, customer service, basic admin, charity/NGO support, nanny/TA, generic creative with no domain anchor.\n",
+    '  T1: Stable but capped. Teacher, nurse, social worker, marketing/HR/recruitment/ops/comms, public-sector researcher, therapist/psychology, non-STEM PhD, generic "research".\n',
+    '  T2: Mid/high potential. Engineer, analyst, product manager, consultant, doctor, solicitor, finance, data, law, scientist, sales, generic "tech/software/PM", STEM PhD, or STUDENT with elite STEM context.\n',
+    '  T3: High trajectory. Investment/banking, management consulting, quant, strategy, PE/VC, corporate law (Magic Circle), AI/data scientist, Big-Tech-calibre product/engineering, "Head/Lead/Director" (early leadership cues).\n',
+    "  T4: Exceptional (rare). Partner/Principal/Director (large firm), VP, funded founder with staff, senior specialist physicians, staff/principal engineer. Require strong textual cues.\n",
+    '- Beneficial-doubt rule for missing or humorous titles: If the job field is empty or clearly humorous (e.g., "Glorified babysitter"), assign **T1 by default**, and upgrade to **T2** if elite-STEM education or strong sector hints justify it.\n',
+    "- University influence: If elite uni AND STEM/quant field hints, allow T2-T3 even for \"Student/PhD\". If elite uni but non-STEM, at most T1-T2 unless sector hints justify higher.\n",
+    "- Vague sector keyword mapping (examples, not exhaustive):\n",
+    '   "Tech/Software/Engineer/Data/PM/AI" -> T2; consider T3 with elite context.\n',
+    '   "Finance/Banking/Investment/Analyst" -> T2; consider T3 with elite context.\n',
+    '   "Consulting/Strategy" -> T2; consider T3 with elite context.\n',
+    '   "Law/Solicitor/Legal" -> T2; consider T3 with Magic Circle/elite context.\n',
+    '   "Marketing/HR/Recruitment/Ops/Comms/Education/Therapy/Research" -> T1 by default; upgrade to T2 only with strong signals.\n',
+    "- Confidence: return confidence 0.0-1.0 for the chosen tier. Do NOT downscale the tier due to low confidence; the optimism rule already limits to a one-step upgrade.\n\n",
+    "C) university_elite\n",
+    "- Elite universities list (case-insensitive exact name match after trimming):\n",
+    '  ["University of Oxford","University of Cambridge","Imperial College London", "UCL", "London School of Economics","Harvard University","Yale University","Princeton University","Stanford University","MIT","Columbia University","ETH Zurich","EPFL","University of Copenhagen","Sorbonne University","University of Tokyo","National University of Singapore","Tsinghua University","Peking University","University of Toronto","Australian National University","University of Melbourne","University of Hong Kong"]\n',
+    '- Matching rule: If the University field contains multiple names or partial mentions (e.g., "Oxford, PhD @ UCL"), treat it as elite if ANY part contains an elite name (case-insensitive). Set matched_university_name to the canonical elite name.\n',
+    "- university_elite = 1 if matched, else 0\n",
+    '- matched_university_name = the canonical elite name matched, else "".\n\n',
+    "--------------------------------------------------------------------------------\n",
+    "OUTPUT EXACTLY ONE JSON OBJECT (no commentary, no code fences):\n\n",
+    "{\n",
+    '  "home_country_iso": "",           // ISO alpha-2 or ""\n',
+    '  "home_country_confidence": 0.0,   // 0.0-1.0\n\n',
+    '  "job": {\n',
+    '    "normalized_title": "",         // concise title or "Unknown"\n',
+    '    "band": "",                     // USE "T0"|"T1"|"T2"|"T3"|"T4"\n',
+    '    "confidence": 0.0,              // 0.0-1.0 confidence for the chosen tier\n',
+    '    "band_reason": ""               // one short sentence justifying the tier choice\n',
+    "  },\n\n",
+    '  "university_elite": 0,            // 1 or 0\n',
+    '  "matched_university_name": ""\n',
+    "}\n",
+])
+
+
 def LLM2(home_town: str, job_title: str, university: str) -> str:
     """
     Build the enrichment prompt for evaluating Home town, Job title, University.
     Returns a single prompt string instructing the model to output EXACTLY one JSON object.
     """
-    parts = [
-        "You are enriching structured dating profile fields for a scoring system. Use ONLY the provided text. Do not browse. Be conservative when uncertain, but apply a slight optimistic bias when inferring future earning potential.\n\n",
-        "INPUT FIELDS (from the extracted JSON):\n",
-        '- "Home town" (string; may be city/region/country or empty)\n',
-        '- "Job title" (string; may be empty)\n',
-        '- "University" (string; may be empty)\n\n',
-        "VALUES:\n",
-        f'Home town: "{home_town or ""}"\n',
-        f'Job title: "{job_title or ""}"\n',
-        f'University: "{university or ""}"\n\n',
-        "YOUR TASKS (3):\n",
-        '1) Resolve "Home town" to an ISO 3166-1 alpha-2 country code (uppercase). If it is a UK city/area (e.g., "Wembley", "Harrow", "Manchester"), return "GB".\n',
-        '2) Estimate FUTURE EARNING POTENTIAL (TIER) from the vague job/study field AND the university context. Titles are often minimal (e.g., "Tech", "Finance", "Product", "Student", "PhD"). Use the tier table in section B and return the corresponding band "T0"-"T4". When uncertain between two adjacent tiers, be slightly optimistic and choose the higher tier by at most one step.\n',
-        '3) Check if "University" matches an elite list (case-insensitive), and return a 1/0 flag and the matched canonical name.\n\n',
-        "--------------------------------------------------------------------------------\n",
-        "A) home_country_iso\n",
-        '- If unresolved: home_country_iso = "" and home_country_confidence = 0.0.\n\n',
-        "B) FUTURE EARNING POTENTIAL (tiers T0-T4) -> job.band\n",
-        "- Goal: infer likely earning trajectory within ~10 years using BOTH job/study field and university context (if visible). Classify into one of these tiers:\n",
-        "  T0: Low/no trajectory. Clear low-mobility sectors with low ceiling and no elite cues: retail, hospitality, customer service, basic admin, charity/NGO support, nanny/TA, generic creative with no domain anchor.\n",
-        '  T1: Stable but capped. Teacher, nurse, social worker, marketing/HR/recruitment/ops/comms, public-sector researcher, therapist/psychology, non-STEM PhD, generic "research".\n',
-        '  T2: Mid/high potential. Engineer, analyst, product manager, consultant, doctor, solicitor, finance, data, law, scientist, sales, generic "tech/software/PM", STEM PhD, or STUDENT with elite STEM context.\n',
-        '  T3: High trajectory. Investment/banking, management consulting, quant, strategy, PE/VC, corporate law (Magic Circle), AI/data scientist, Big-Tech-calibre product/engineering, "Head/Lead/Director" (early leadership cues).\n',
-        "  T4: Exceptional (rare). Partner/Principal/Director (large firm), VP, funded founder with staff, senior specialist physicians, staff/principal engineer. Require strong textual cues.\n",
-        '- Beneficial-doubt rule for missing or humorous titles: If the job field is empty or clearly humorous (e.g., "Glorified babysitter"), assign **T1 by default**, and upgrade to **T2** if elite-STEM education or strong sector hints justify it.\n',
-        "- University influence: If elite uni AND STEM/quant field hints, allow T2-T3 even for \"Student/PhD\". If elite uni but non-STEM, at most T1-T2 unless sector hints justify higher.\n",
-        "- Vague sector keyword mapping (examples, not exhaustive):\n",
-        '   "Tech/Software/Engineer/Data/PM/AI" -> T2; consider T3 with elite context.\n',
-        '   "Finance/Banking/Investment/Analyst" -> T2; consider T3 with elite context.\n',
-        '   "Consulting/Strategy" -> T2; consider T3 with elite context.\n',
-        '   "Law/Solicitor/Legal" -> T2; consider T3 with Magic Circle/elite context.\n',
-        '   "Marketing/HR/Recruitment/Ops/Comms/Education/Therapy/Research" -> T1 by default; upgrade to T2 only with strong signals.\n',
-        "- Confidence: return confidence 0.0-1.0 for the chosen tier. Do NOT downscale the tier due to low confidence; the optimism rule already limits to a one-step upgrade.\n\n",
-        "C) university_elite\n",
-        "- Elite universities list (case-insensitive exact name match after trimming):\n",
-        '  ["University of Oxford","University of Cambridge","Imperial College London", "UCL", "London School of Economics","Harvard University","Yale University","Princeton University","Stanford University","MIT","Columbia University","ETH Zurich","EPFL","University of Copenhagen","Sorbonne University","University of Tokyo","National University of Singapore","Tsinghua University","Peking University","University of Toronto","Australian National University","University of Melbourne","University of Hong Kong"]\n',
-        '- Matching rule: If the University field contains multiple names or partial mentions (e.g., "Oxford, PhD @ UCL"), treat it as elite if ANY part contains an elite name (case-insensitive). Set matched_university_name to the canonical elite name.\n',
-        "- university_elite = 1 if matched, else 0\n",
-        '- matched_university_name = the canonical elite name matched, else "".\n\n',
-        "--------------------------------------------------------------------------------\n",
-        "OUTPUT EXACTLY ONE JSON OBJECT (no commentary, no code fences):\n\n",
-        "{\n",
-        '  "home_country_iso": "",           // ISO alpha-2 or ""\n',
-        '  "home_country_confidence": 0.0,   // 0.0-1.0\n\n',
-        '  "job": {\n',
-        '    "normalized_title": "",         // concise title or "Unknown"\n',
-        '    "band": "",                     // USE "T0"|"T1"|"T2"|"T3"|"T4"\n',
-        '    "confidence": 0.0,              // 0.0-1.0 confidence for the chosen tier\n',
-        '    "band_reason": ""               // one short sentence justifying the tier choice\n',
-        "  },\n\n",
-        '  "university_elite": 0,            // 1 or 0\n',
-        '  "matched_university_name": ""\n',
-        "}\n",
-    ]
-    return "".join(parts)
+    return (
+        _LLM2_HEAD
+        + f'Home town: "{home_town or ""}"\n'
+        + f'Job title: "{job_title or ""}"\n'
+        + f'University: "{university or ""}"\n\n'
+        + _LLM2_TAIL
+    )
 
 
 def LLM3_LONG(extracted: Dict[str, Any]) -> str:
@@ -12,7 +12,7 @@ from typing import Any, Dict, Tuple
 import config  # ensure .env is loaded early
 
 from helper_functions import ensure_adb_running, connect_device, get_screen_resolution, open_hinge
-from extraction import run_llm1_visual, run_profile_eval_llm, _build_extracted_profile
+from extraction import run_llm1_and_profile_eval
 from openers import run_llm3_long, run_llm3_short, run_llm4
 from profile_utils import _get_core, _norm_value
 from runtime import _is_run_json_enabled, _log
@@ -49,6 +49,7 @@ from ui_scan import (
     _seek_photo_by_index,
     _seek_photo_by_index_from_bottom,
     _seek_target_on_screen,
+    _wait_for_profile_ready,
 )
 
 
@@ -73,7 +74,7 @@ def _init_device(device_ip: str):
         return None, 0, 0
     width, height = get_screen_resolution(device)
     open_hinge(device)
-    time.sleep(5)
+    _wait_for_profile_ready(device)
     return device, width, height
 
 
@@ -93,10 +94,13 @@ def _confirm_action(action_label: str, unrestricted: bool) -> bool:
         return False
 
 
-def _tap_bounds(device, bounds: Tuple[int, int, int, int], width: int, height: int) -> Tuple[int, int]:
+def _clamped_center(bounds: Tuple[int, int, int, int], width: int, height: int) -> Tuple[int, int]:
     tap_x, tap_y = _bounds_center(bounds)
-    tap_x = max(0, min(width - 1, tap_x))
-    tap_y = max(0, min(height - 1, tap_y))
+    return max(0, min(width - 1, tap_x)), max(0, min(height - 1, tap_y))
+
+
+def _tap_bounds(device, bounds: Tuple[int, int, int, int], width: int, height: int) -> Tuple[int, int]:
+    tap_x, tap_y = _clamped_center(bounds, width, height)
     from helper_functions import tap
     tap(device, tap_x, tap_y)
     return tap_x, tap_y
@@ -150,16 +154,12 @@ def main() -> int:
     scan_nodes = scan_result.get("nodes")
 
     _log(f"[LLM1] Sending {len(photo_paths)} photos for visual analysis")
-    llm1_result, llm1_meta = run_llm1_visual(
+    extracted, llm1_meta, eval_result = run_llm1_and_profile_eval(
+        biometrics,
+        ui_map,
         photo_paths,
         model=os.getenv("LLM_SMALL_MODEL") or os.getenv("GEMINI_SMALL_MODEL") or None,
     )
-    extracted = _build_extracted_profile(biometrics, ui_map, llm1_result)
-
-    eval_result = run_profile_eval_llm(
-        extracted,
-        model=os.getenv("LLM_SMALL_MODEL") or os.getenv("GEMINI_SMALL_MODEL") or None,
-    )
     long_score_result = _score_profile_long(extracted, eval_result)
     short_score_result = _score_profile_short(extracted, eval_result)
     score_table_long = _format_score_table("Long", long_score_result)
@@ -402,7 +402,6 @@ def main() -> int:
                             cur_scroll_area,
                             int(target_hash),
                             expected_screen_y=expected_screen_y,
-                            max_dist=18,
                             square_only=True,
                         )
                         if match_bounds:
@@ -576,11 +575,8 @@ def main() -> int:
         try:
             _tap_bounds(device, comment_bounds, width, height)
             time.sleep(0.4)
-            from helper_functions import input_text, hide_keyboard
-            input_text(device, chosen_text.strip())
-            time.sleep(0.2)
-            hide_keyboard(device)
-            time.sleep(0.6)
+            from helper_functions import input_text_and_hide_keyboard
+            input_text_and_hide_keyboard(device, chosen_text.strip())
         except Exception as e:
             raise RuntimeError(f"Failed to enter comment: {e}")
 
@@ -609,11 +605,8 @@ def main() -> int:
                 recovery_nodes = _parse_ui_nodes(_dump_ui_xml(device))
                 recovery_bounds = _find_add_comment_bounds(recovery_nodes)
                 if recovery_bounds:
-                    _tap_bounds(device, recovery_bounds, width, height)
-                    time.sleep(0.3)
-                    from helper_functions import hide_keyboard
-                    hide_keyboard(device)
-                    time.sleep(0.6)
+                    from helper_functions import tap_and_hide_keyboard
+                    tap_and_hide_keyboard(device, *_clamped_center(recovery_bounds, width, height))
                     for attempt in range(4):
                         post_xml = _dump_ui_xml(device)
                         post_nodes = _parse_ui_nodes(post_xml)
@@ -0,0 +1,23 @@
+import helper_functions
+
+
+class _Device:
+    def __init__(self, serial, devpath):
+        self.serial = serial
+        self._devpath = devpath
+
+    def get_device_path(self):
+        return self._devpath
+
+
+def test_usb_transport_detected_from_devpath(monkeypatch):
+    monkeypatch.setattr(helper_functions, "_USB_TRANSPORT_CACHE", {})
+    assert helper_functions.is_usb_transport(_Device("R58M12ABC", "usb:1-1.2"))
+
+
+def test_wireless_transports_are_not_usb(monkeypatch):
+    monkeypatch.setattr(helper_functions, "_USB_TRANSPORT_CACHE", {})
+    mdns = _Device("adb-R58M12ABC-x1y2z3._adb-tls-connect._tcp", "unknown")
+    tcp = _Device("192.168.1.20:5555", "unknown")
+    assert not helper_functions.is_usb_transport(mdns)
+    assert not helper_functions.is_usb_transport(tcp)
@@ -0,0 +1,127 @@
+import random
+
+from PIL import Image, ImageDraw, ImageEnhance, ImageFilter
+
+import ui_scan
+
+
+def _patch_hscroll(monkeypatch, swipes):
+    monkeypatch.setattr(ui_scan, "_find_horizontal_scroll_area", lambda nodes, area: (0, 400, 1080, 500))
+    monkeypatch.setattr(ui_scan, "_hscroll_once", lambda device, area, direction: swipes.append(direction))
+    monkeypatch.setattr(ui_scan, "_dump_nodes_after_gesture", lambda device, nodes, area: (nodes, area, set(), set()))
+    monkeypatch.setattr(ui_scan, "_extract_biometrics_from_nodes", lambda nodes, area: {})
+
+
+def test_hscroll_stops_once_row_is_filled(monkeypatch):
+    swipes = []
+    _patch_hscroll(monkeypatch, swipes)
+    biometrics = {k: "x" for k in ui_scan._HSCROLL_BIOMETRIC_FIELDS}
+
+    ui_scan._scan_biometrics_hscroll(None, [], (0, 0, 1080, 2400), biometrics)
+
+    assert swipes == []
+
+
+def test_hscroll_keeps_swiping_while_row_is_incomplete(monkeypatch):
+    swipes = []
+    _patch_hscroll(monkeypatch, swipes)
+    # One chip short of a full row (e.g. a hidden Drugs chip) must still swipe.
+    biometrics = {k: "x" for k in ui_scan._HSCROLL_BIOMETRIC_FIELDS[:-1]}
+
+    ui_scan._scan_biometrics_hscroll(None, [], (0, 0, 1080, 2400), biometrics)
+
+    # No new values appear, so the loop ends on the two-empty-swipes rule instead.
+    assert swipes == ["left", "left"]
+
+
+class _Device:
+    serial = "adb-R58M12ABC-x1y2z3._adb-tls-connect._tcp"
+
+
+def test_raw_screencap_follows_transport(monkeypatch):
+    monkeypatch.delenv("HINGE_RAW_SCREENCAP", raising=False)
+    monkeypatch.setattr(ui_scan, "is_usb_transport", lambda device: False)
+    assert not ui_scan._use_raw_screencap(_Device())
+    monkeypatch.setattr(ui_scan, "is_usb_transport", lambda device: True)
+    assert ui_scan._use_raw_screencap(_Device())
+
+
+def test_raw_screencap_env_override(monkeypatch):
+    monkeypatch.setattr(ui_scan, "is_usb_transport", lambda device: True)
+    monkeypatch.setenv("HINGE_RAW_SCREENCAP", "0")
+    assert not ui_scan._use_raw_screencap(_Device())
+
+
+def _photo(seed, size=900):
+    rng = random.Random(seed)
+    img = Image.linear_gradient("L").resize((size, size)).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    for _ in range(25):
+        x, y = rng.randrange(size), rng.randrange(size)
+        w, h = rng.randrange(80, 400), rng.randrange(80, 400)
+        draw.ellipse((x - w // 2, y - h // 2, x + w // 2, y + h // 2), fill=tuple(rng.randrange(256) for _ in range(3)))
+    return img.filter(ImageFilter.GaussianBlur(6))
+
+
+def _recapture(img):
+    # Same photo seen again: slightly different bounds and scale, brighter, with a like button overlay.
+    w, h = img.size
+    shot = img.crop((6, 10, w - 4, h - 8)).resize((1000, 1000))
+    shot = ImageEnhance.Brightness(shot).enhance(1.08)
+    ImageDraw.Draw(shot).ellipse((880, 880, 980, 980), fill=(255, 255, 255))
+    return shot
+
+
+def test_hash_thresholds_separate_same_and_different_photos():
+    for seed in range(10):
+        photo = _photo(seed)
+        h = ui_scan._compute_center_hash(photo)
+        same = ui_scan._hash_distance(h, ui_scan._compute_center_hash(_recapture(photo)))
+        other = ui_scan._hash_distance(h, ui_scan._compute_center_hash(_photo(seed + 1000)))
+        assert same <= ui_scan._HASH_DUPLICATE_DIST < ui_scan._HASH_MATCH_MAX_DIST
+        assert other > ui_scan._HASH_MATCH_MAX_DIST
+
+
+def test_identical_frame_is_within_early_exit():
+    photo = _photo(7)
+    h = ui_scan._compute_center_hash(photo)
+    assert ui_scan._hash_distance(h, ui_scan._compute_center_hash(photo.copy())) <= ui_scan._HASH_EARLY_EXIT_DIST
+
+
+_XML = '<?xml version="1.0"?><hierarchy rotation="0"><node bounds="[0,0][10,10]" /></hierarchy>'
+
+
+class _DumpDevice:
+    def __init__(self, tty_out, file_out):
+        self.tty_out = tty_out
+        self.file_out = file_out
+
+    def shell(self, cmd):
+        return self.tty_out if cmd == "uiautomator dump /dev/tty" else self.file_out
+
+
+def test_transient_dump_failure_keeps_tty_undecided(monkeypatch):
+    monkeypatch.setattr(ui_scan, "_DUMP_TO_TTY", None)
+    assert ui_scan._dump_ui_xml(_DumpDevice("ERROR: could not get idle state.", "")) == ""
+    assert ui_scan._DUMP_TO_TTY is None
+
+
+def test_tty_disabled_only_when_temp_file_dump_works(monkeypatch):
+    monkeypatch.setattr(ui_scan, "_DUMP_TO_TTY", None)
+    assert ui_scan._dump_ui_xml(_DumpDevice("", _XML))
+    assert ui_scan._DUMP_TO_TTY is False
+
+
+def test_wait_for_profile_ready_stays_within_budget(monkeypatch):
+    clock = [0.0]
+
+    def slow_dump(device):
+        clock[0] += 1.5
+        return ""
+
+    monkeypatch.setattr(ui_scan.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(ui_scan.time, "sleep", lambda s: clock.__setitem__(0, clock[0] + s))
+    monkeypatch.setattr(ui_scan, "_dump_ui_xml", slow_dump)
+
+    assert ui_scan._wait_for_profile_ready(None) is False
+    assert clock[0] <= 5.0
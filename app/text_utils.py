@@ -1,8 +1,14 @@
 # app/text_utils.py
 # Small text normalization utilities shared across LLM call sites.
 
+import json
 from typing import Any
 
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 
 def normalize_dashes(value: Any) -> Any:
     """
@@ -16,3 +22,14 @@ def normalize_dashes(value: Any) -> Any:
     if isinstance(value, dict):
         return {k: normalize_dashes(v) for k, v in value.items()}
     return value
+
+
+def loads_json(raw: str) -> Any:
+    """
+    Parse an LLM JSON response body ("" -> {}). Uses orjson when installed.
+    """
+    if not raw:
+        return {}
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
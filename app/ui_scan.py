@@ -1,105 +1,146 @@
+import itertools
 import os
+import re
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from PIL import Image
 
-from helper_functions import swipe, tap
+from helper_functions import is_usb_transport, screencap_png, screencap_raw, swipe, tap
 from runtime import _log
 from text_utils import normalize_dashes
 
+# Patterns used on every UI dump; compiled once.
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9\s]")
+_SKIP_NAME_RE = re.compile(r"^Skip\s+(.+)$", flags=re.IGNORECASE)
+_PHOTO_NAME_RE = re.compile(r"^(.+?)(?:'s|’s)\s+photo$", flags=re.IGNORECASE)
+_DIGITS_RE = re.compile(r"\d+")
+
+
 def _normalize_text_basic(text: str) -> str:
-    import re
     s = (text or "").lower()
     s = normalize_dashes(s)
-    s = re.sub(r"[^a-z0-9\s]", " ", s)
+    s = _NON_ALNUM_RE.sub(" ", s)
     return " ".join(s.split())
 
 
-def _compute_ahash(img: Image.Image, size: int = 8) -> int:
+def _node_norm(node: Dict[str, Any], field: str) -> str:
+    """
+    Normalized node text/content_desc, memoized on the node so repeated finders
+    over the same dump (shared via the parse cache) normalize each node once.
+    """
+    cache_key = f"norm_{field}"
+    value = node.get(cache_key)
+    if value is None:
+        value = _normalize_text_basic(node.get(field) or "")
+        node[cache_key] = value
+    return value
+
+
+_SEND_PRIORITY_LIKE_NORM = _normalize_text_basic("send priority like with message")
+_SEND_LIKE_ANYWAY_NORM = _normalize_text_basic("send like anyway")
+
+
+# Hamming-distance thresholds for 63-bit photo pHashes (pinned by tests/test_ui_scan.py).
+_HASH_MATCH_MAX_DIST = 18
+_HASH_EARLY_EXIT_DIST = 4
+_HASH_DUPLICATE_DIST = 6
+
+
+def _compute_phash(img: Image.Image, size: int = 8, highfreq_factor: int = 4) -> int:
+    """
+    DCT pHash: 32x32 grayscale, keep the low size x size frequencies, drop DC and
+    set one bit per coefficient above their median (63 bits for size=8).
+    """
+    # Imported here so startup does not pay for OpenCV/numpy before the first hash.
+    import cv2
+    import numpy as np
+
     if img.mode != "L":
         img = img.convert("L")
+    n = size * highfreq_factor
     resample = getattr(Image, "LANCZOS", 1)
-    small = img.resize((size, size), resample)
-    pixels = list(small.getdata())
-    if not pixels:
-        return 0
-    avg = sum(pixels) / len(pixels)
-    bits = 0
-    for i, p in enumerate(pixels):
-        if p >= avg:
-            bits |= 1 << i
-    return bits
-
-
-def _compute_center_ahash(
+    # Box-reduce to ~2x the target first; LANCZOS then only runs over a tiny image.
+    small = img.resize((n, n), resample, reducing_gap=2.0)
+    dct = cv2.dct(np.asarray(small, dtype=np.float32))
+    low = dct[:size, :size].ravel()[1:]
+    bits = np.packbits(low > np.median(low), bitorder="little")
+    return int.from_bytes(bits.tobytes(), "little")
+
+
+def _compute_center_hash(
     img: Image.Image,
     size: int = 8,
     crop_ratio: float = 0.6,
 ) -> int:
     """
-    Compute aHash on a center crop to reduce UI overlay influence (e.g., like button).
+    Compute pHash on a center crop to reduce UI overlay influence (e.g., like button).
     """
     try:
         w, h = img.size
         side = int(min(w, h) * crop_ratio)
         if side <= 0:
-            return _compute_ahash(img, size=size)
+            return _compute_phash(img, size=size)
         left = max(0, (w - side) // 2)
         top = max(0, (h - side) // 2)
         crop = img.crop((left, top, left + side, top + side))
-        return _compute_ahash(crop, size=size)
+        return _compute_phash(crop, size=size)
     except Exception:
-        return _compute_ahash(img, size=size)
+        return _compute_phash(img, size=size)
 
 
-def _ahash_distance(a: int, b: int) -> int:
+def _hash_distance(a: int, b: int) -> int:
     return (a ^ b).bit_count()
 
 
-def _compute_center_ahash_from_file(
-    path: str,
-    crop_ratio: float = 0.6,
-) -> Optional[int]:
-    if not path or not os.path.isfile(path):
-        return None
-    try:
-        img = Image.open(path).convert("RGB")
-        return _compute_center_ahash(img, crop_ratio=crop_ratio)
-    except Exception:
-        return None
-
-
 def _extract_xml_root(raw: str) -> str:
     """
-    UIAutomator dumps sometimes include prefix text. Strip to the <hierarchy> root.
+    UIAutomator dumps sometimes include prefix/suffix text. Strip to the <hierarchy> root.
     """
     if not raw:
         return ""
     idx = raw.find("<hierarchy")
     if idx == -1:
         return ""
-    return raw[idx:]
+    end = raw.rfind("</hierarchy>")
+    if end == -1:
+        return raw[idx:]
+    return raw[idx:end + len("</hierarchy>")]
+
+
+# Whether `uiautomator dump /dev/tty` streams XML on this device (None = untested).
+_DUMP_TO_TTY: Optional[bool] = None
 
 
 def _dump_ui_xml(device, tmp_path: str = "/sdcard/hinge_ui.xml") -> str:
     """
-    Dump UI hierarchy to a temp path on-device and return the XML string.
-    Uses a single rotating file to avoid cluttering the device storage.
+    Dump UI hierarchy and return the XML string.
+    Streams the dump over the shell (/dev/tty) when the device supports it;
+    otherwise writes a single rotating temp file on-device, reads and removes it
+    in one shell round-trip.
     """
+    global _DUMP_TO_TTY
     try:
-        device.shell(f"uiautomator dump {tmp_path}")
-        raw = device.shell(f"cat {tmp_path}")
-        # Best-effort cleanup; ignore failures.
-        try:
-            device.shell(f"rm {tmp_path}")
-        except Exception:
-            pass
+        tty_unproven = False
+        if _DUMP_TO_TTY is not False:
+            xml = _extract_xml_root(device.shell("uiautomator dump /dev/tty"))
+            if xml:
+                _DUMP_TO_TTY = True
+                return xml
+            tty_unproven = _DUMP_TO_TTY is None
+        raw = device.shell(
+            f"uiautomator dump {tmp_path} >/dev/null && cat {tmp_path}; rm -f {tmp_path}"
+        )
         xml = _extract_xml_root(raw)
         if not xml:
+            # Both paths failed (e.g. no idle state mid-animation); try /dev/tty again next time.
             _log("[UI] Empty/invalid XML dump")
+        elif tty_unproven:
+            _DUMP_TO_TTY = False
+            _log("[UI] /dev/tty dump unsupported; using temp file")
         return xml
     except Exception as e:
         _log(f"[UI] XML dump failed: {e}")
@@ -200,11 +241,14 @@ def _find_prompt_bounds_by_text(
         cd = (n.get("content_desc") or "").strip()
         if not cd.startswith("Prompt:"):
             continue
-        p_txt, a_txt = _parse_prompt_content_desc(cd)
-        if not p_txt or not a_txt:
-            continue
-        key = _normalize_text_basic(p_txt) + "||" + _normalize_text_basic(a_txt)
-        if key == target_key:
+        key = n.get("norm_prompt_key")
+        if key is None:
+            p_txt, a_txt = _parse_prompt_content_desc(cd)
+            key = ""
+            if p_txt and a_txt:
+                key = _normalize_text_basic(p_txt) + "||" + _normalize_text_basic(a_txt)
+            n["norm_prompt_key"] = key
+        if key and key == target_key:
             return n.get("bounds")
     return None
 
@@ -278,7 +322,8 @@ def _flatten_ui_nodes(root: ET.Element) -> List[Dict[str, Any]]:
             "scrollable": attrs.get("scrollable", "") == "true",
             "bounds": bounds,
         }
-        if bounds:
+        # Zero-area nodes are off-screen/collapsed; no finder can use or tap them.
+        if bounds and bounds[2] > bounds[0] and bounds[3] > bounds[1]:
             nodes.append(node)
         for child in list(el):
             walk(child)
@@ -287,14 +332,23 @@ def _flatten_ui_nodes(root: ET.Element) -> List[Dict[str, Any]]:
     return nodes
 
 
+# Last (xml, nodes) pair; unchanged screens (no-move scrolls, retry loops) skip re-parsing.
+_LAST_PARSE: Tuple[str, List[Dict[str, Any]]] = ("", [])
+
+
 def _parse_ui_nodes(xml_text: str) -> List[Dict[str, Any]]:
+    global _LAST_PARSE
     if not xml_text:
         return []
+    if xml_text == _LAST_PARSE[0]:
+        return list(_LAST_PARSE[1])
     try:
         root = ET.fromstring(xml_text)
     except Exception:
         return []
-    return _flatten_ui_nodes(root)
+    nodes = _flatten_ui_nodes(root)
+    _LAST_PARSE = (xml_text, nodes)
+    return list(nodes)
 
 
 def _find_scroll_area(nodes: List[Dict[str, Any]]) -> Optional[Tuple[int, int, int, int]]:
@@ -351,45 +405,38 @@ def _find_add_comment_bounds(nodes: List[Dict[str, Any]]) -> Optional[Tuple[int,
         tx = (n.get("text") or "").strip().lower()
         if tx == "add a comment":
             return n.get("bounds")
-    for n in nodes:
-        b = n.get("bounds")
-        if not b:
-            continue
-        tx = (n.get("text") or "").strip().lower()
-        if tx != "add a comment":
-            continue
-        return b
     return None
 
 
-def _find_send_priority_like_bounds(nodes: List[Dict[str, Any]]) -> Optional[Tuple[int, int, int, int]]:
-    target_norm = _normalize_text_basic("send priority like with message")
+def _find_button_bounds_by_norm(
+    nodes: List[Dict[str, Any]],
+    target_norm: str,
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Bounds of the clickable container around the first node whose normalized
+    content-desc or text equals target_norm.
+    """
     for n in nodes:
-        cd = _normalize_text_basic(n.get("content_desc") or "")
-        if cd == target_norm:
-            return _find_enclosing_bounds(nodes, n.get("bounds"))
-        tx = _normalize_text_basic(n.get("text") or "")
-        if tx == target_norm:
+        if _node_norm(n, "content_desc") == target_norm or _node_norm(n, "text") == target_norm:
             return _find_enclosing_bounds(nodes, n.get("bounds"))
     return None
 
 
+def _find_send_priority_like_bounds(nodes: List[Dict[str, Any]]) -> Optional[Tuple[int, int, int, int]]:
+    return _find_button_bounds_by_norm(nodes, _SEND_PRIORITY_LIKE_NORM)
+
+
 def _find_send_like_anyway_bounds(nodes: List[Dict[str, Any]]) -> Optional[Tuple[int, int, int, int]]:
-    target_norm = _normalize_text_basic("send like anyway")
-    for n in nodes:
-        cd = _normalize_text_basic(n.get("content_desc") or "")
-        if cd == target_norm:
-            return _find_enclosing_bounds(nodes, n.get("bounds"))
-        tx = _normalize_text_basic(n.get("text") or "")
-        if tx == target_norm:
-            return _find_enclosing_bounds(nodes, n.get("bounds"))
-    return None
+    return _find_button_bounds_by_norm(nodes, _SEND_LIKE_ANYWAY_NORM)
 
 
 def _clean_name_text(text: str) -> str:
     return (text or "").strip().strip(" .,!?:;")
 
 
+_NAME_PUNCT_DELETE = str.maketrans("", "", " -'’")
+
+
 def _looks_like_name(text: str) -> bool:
     t = (text or "").strip()
     if not t or len(t) > 40:
@@ -399,17 +446,8 @@ def _looks_like_name(text: str) -> bool:
         return False
     if lower.startswith("active "):
         return False
-    if any(ch.isdigit() for ch in t):
-        return False
-    has_alpha = False
-    for ch in t:
-        if ch.isalpha():
-            has_alpha = True
-            continue
-        if ch in " -'’":
-            continue
-        return False
-    return has_alpha
+    # Letters plus name punctuation only, with at least one letter.
+    return t.translate(_NAME_PUNCT_DELETE).isalpha()
 
 
 def _extract_name_from_nodes(
@@ -418,13 +456,12 @@ def _extract_name_from_nodes(
 ) -> str:
     if not nodes:
         return ""
-    import re
 
     for n in nodes:
         cd = (n.get("content_desc") or "").strip()
         if not cd:
             continue
-        m = re.match(r"^Skip\s+(.+)$", cd, flags=re.IGNORECASE)
+        m = _SKIP_NAME_RE.match(cd)
         if m:
             name = _clean_name_text(m.group(1))
             if _looks_like_name(name):
@@ -434,7 +471,7 @@ def _extract_name_from_nodes(
         cd = (n.get("content_desc") or "").strip()
         if not cd:
             continue
-        m = re.match(r"^(.+?)(?:'s|’s)\s+photo$", cd, flags=re.IGNORECASE)
+        m = _PHOTO_NAME_RE.match(cd)
         if m:
             name = _clean_name_text(m.group(1))
             if _looks_like_name(name):
@@ -601,6 +638,31 @@ _BIOMETRIC_LABEL_MAP = {
     "drugs": "Drugs",
     "location": "Location",
 }
+# Fields shown as chips in the horizontal biometrics row (the rest sit in vertical rows below).
+_HSCROLL_BIOMETRIC_FIELDS = (
+    "Age",
+    "Gender",
+    "Sexuality",
+    "Height",
+    "Location",
+    "Explicit Ethnicity",
+    "Children",
+    "Family plans",
+    "Covid Vaccine",
+    "Pets",
+    "Zodiac Sign",
+    "Drinking",
+    "Smoking",
+    "Marijuana",
+    "Drugs",
+)
+
+
+def _hscroll_row_filled(biometrics: Dict[str, Any]) -> bool:
+    # Only a complete row ends the swipe early; hidden chips fall to the no-new-values rule.
+    return all(biometrics.get(k) not in ("", None) for k in _HSCROLL_BIOMETRIC_FIELDS)
+
+
 def _normalize_label(text: str) -> str:
     return " ".join((text or "").strip().lower().split())
 
@@ -610,8 +672,7 @@ def _parse_height_value(raw: str) -> Optional[int]:
         return None
     s = raw.strip().lower()
     # If explicitly in cm (or looks like cm), take first number.
-    import re
-    nums = [int(n) for n in re.findall(r"\d+", s)]
+    nums = [int(n) for n in _DIGITS_RE.findall(s)]
     if not nums:
         return None
     if "cm" in s or (nums and nums[0] >= 100):
@@ -699,6 +760,63 @@ def _extract_biometrics_from_nodes(
     return updates
 
 
+_SETTLE_FLOOR_S = 0.2
+
+
+def _dump_nodes_after_gesture(
+    device,
+    prev_nodes: List[Dict[str, Any]],
+    scroll_area: Tuple[int, int, int, int],
+) -> Tuple[List[Dict[str, Any]], Tuple[int, int, int, int], Set[Tuple[str, int]], Set[Tuple[str, int]]]:
+    """
+    Dump the UI after a swipe. uiautomator dump already waits for an idle UI, so
+    only a short floor is slept; if the screen still matches the previous one,
+    wait once more and re-dump in case the gesture had not landed yet.
+    Returns (nodes, scroll_area, prev_sig, curr_sig) so callers reuse the signatures.
+    """
+    time.sleep(_SETTLE_FLOOR_S)
+    nodes = _parse_ui_nodes(_dump_ui_xml(device))
+    area = _find_scroll_area(nodes) or scroll_area
+    prev_sig = _screen_signature(prev_nodes, area)
+    curr_sig = _screen_signature(nodes, area)
+    if prev_nodes and prev_sig == curr_sig:
+        time.sleep(_SETTLE_FLOOR_S)
+        nodes = _parse_ui_nodes(_dump_ui_xml(device))
+        new_area = _find_scroll_area(nodes) or scroll_area
+        if new_area != area:
+            area = new_area
+            prev_sig = _screen_signature(prev_nodes, area)
+        curr_sig = _screen_signature(nodes, area)
+    return nodes, area, prev_sig, curr_sig
+
+
+def _wait_for_profile_ready(device, max_s: float = 5.0, poll_s: float = 0.25) -> bool:
+    """
+    Poll UI dumps after launching the app until the profile scroll area is present
+    and two consecutive dumps match. A dump is only started if it is expected to
+    finish within max_s, so the wait never outlasts the budget. Returns True once stable.
+    """
+    deadline = time.monotonic() + max_s
+    prev_sig: Optional[Set[Tuple[str, int]]] = None
+    while True:
+        started = time.monotonic()
+        try:
+            nodes = _parse_ui_nodes(_dump_ui_xml(device))
+        except Exception as e:
+            _log(f"[UI] wait for profile dump failed: {e}")
+            nodes = []
+        dump_s = time.monotonic() - started
+        area = _find_scroll_area(nodes)
+        sig = _screen_signature(nodes, area) if area else None
+        if sig and sig == prev_sig:
+            return True
+        prev_sig = sig
+        if time.monotonic() + poll_s + dump_s > deadline:
+            _log(f"[UI] profile not stable after {max_s:.1f}s; continuing")
+            return False
+        time.sleep(poll_s)
+
+
 def _hscroll_once(
     device,
     area: Tuple[int, int, int, int],
@@ -739,10 +857,11 @@ def _scan_biometrics_hscroll(
     swipes_done = 0
     no_new = 0
     while swipes_done < max_swipes and no_new < 2:
+        if _hscroll_row_filled(biometrics):
+            _log("[BIOMETRICS] horizontal row filled; stopping hscroll")
+            break
         _hscroll_once(device, h_area, "left")
-        time.sleep(0.4)
-        xml = _dump_ui_xml(device)
-        nodes = _parse_ui_nodes(xml)
+        nodes, _, _, _ = _dump_nodes_after_gesture(device, nodes, scroll_area)
         updates = _extract_biometrics_from_nodes(nodes, scroll_area)
         new_any = False
         for k, v in updates.items():
@@ -987,7 +1106,35 @@ def _is_square_bounds(bounds: Tuple[int, int, int, int], tol: int = 12) -> bool:
     return abs(w - h) <= tol
 
 
-def _compute_center_ahash_from_bounds(
+def _use_raw_screencap(device) -> bool:
+    """
+    Raw RGBA frames are ~4x larger than PNG, which only pays off over USB.
+    HINGE_RAW_SCREENCAP=1/0 forces the choice; otherwise the adb transport decides.
+    """
+    forced = os.getenv("HINGE_RAW_SCREENCAP", "").strip()
+    if forced in ("0", "1"):
+        return forced == "1"
+    return is_usb_transport(device)
+
+
+def _screencap_image(device) -> Image.Image:
+    """
+    Full-screen frame: raw RGBA when _use_raw_screencap allows it, PNG otherwise.
+    """
+    if _use_raw_screencap(device):
+        try:
+            raw = screencap_raw(device)
+            if raw:
+                w, h, pixels = raw
+                return Image.frombuffer("RGBA", (w, h), pixels, "raw", "RGBA", 0, 1)
+        except Exception as e:
+            _log(f"[PHOTO] raw screencap failed; using PNG: {e}")
+    img = Image.open(BytesIO(screencap_png(device)))
+    img.load()
+    return img
+
+
+def _compute_center_hash_from_bounds(
     device,
     bounds: Tuple[int, int, int, int],
     width: int,
@@ -998,10 +1145,8 @@ def _compute_center_ahash_from_bounds(
     if not cb:
         return None
     try:
-        img_bytes = device.screencap()
-        img = Image.open(BytesIO(img_bytes)).convert("RGB")
-        crop = img.crop(cb)
-        return _compute_center_ahash(crop, crop_ratio=crop_ratio)
+        crop = _screencap_image(device).crop(cb)
+        return _compute_center_hash(crop, crop_ratio=crop_ratio)
     except Exception:
         return None
 
@@ -1014,8 +1159,9 @@ def _match_photo_bounds_by_hash(
     scroll_area: Tuple[int, int, int, int],
     target_hash: int,
     expected_screen_y: Optional[int] = None,
-    max_dist: int = 18,
+    max_dist: int = _HASH_MATCH_MAX_DIST,
     square_only: bool = True,
+    early_exit_dist: int = _HASH_EARLY_EXIT_DIST,
 ) -> Tuple[Optional[Tuple[int, int, int, int]], Optional[int]]:
     candidates = _find_visible_photo_bounds_all(nodes, scroll_area)
     if not candidates:
@@ -1028,23 +1174,30 @@ def _match_photo_bounds_by_hash(
             _log("[TARGET] no square photo candidates; retrying with partials")
     if expected_screen_y is not None:
         candidates.sort(key=lambda b: abs(_bounds_center(b)[1] - expected_screen_y))
-    img_bytes = device.screencap()
-    img = Image.open(BytesIO(img_bytes)).convert("RGB")
-    best_bounds = None
-    best_dist = None
-    for b in candidates:
-        cb = _clamp_bounds_to_screen(b, width, height)
-        if not cb:
-            continue
-        crop = img.crop(cb)
-        h = _compute_center_ahash(crop)
-        dist = _ahash_distance(h, target_hash)
+    img = _screencap_image(device)
+    clamped = [cb for cb in (_clamp_bounds_to_screen(b, width, height) for b in candidates) if cb]
+    if not clamped:
+        return None, None
+    first_dist = _hash_distance(_compute_center_hash(img.crop(clamped[0])), target_hash)
+    _log(f"[TARGET] photo hash candidate bounds={clamped[0]} dist={first_dist}")
+    # Only with expected_screen_y are candidates nearest-first; a near-exact hit on
+    # the nearest one then makes hashing the rest unnecessary.
+    if expected_screen_y is not None and first_dist <= early_exit_dist:
+        return clamped[0], first_dist
+    best_bounds = clamped[0]
+    best_dist = first_dist
+    rest = clamped[1:]
+    hashes: List[int] = []
+    if rest:
+        # PIL crop/convert/resize and cv2.dct release the GIL, so candidate hashes run concurrently.
+        with ThreadPoolExecutor(max_workers=min(3, len(rest))) as pool:
+            hashes = list(pool.map(lambda cb: _compute_center_hash(img.crop(cb)), rest))
+    for cb, h in zip(rest, hashes):
+        dist = _hash_distance(h, target_hash)
         _log(f"[TARGET] photo hash candidate bounds={cb} dist={dist}")
-        if best_dist is None or dist < best_dist:
+        if dist < best_dist:
             best_dist = dist
             best_bounds = cb
-    if best_dist is None:
-        return None, None
     if best_dist <= max_dist:
         return best_bounds, best_dist
     return None, best_dist
@@ -1060,28 +1213,7 @@ def _find_like_button_in_photo(
     best = None
     best_score = None
     best_desc = ""
-    for n in nodes:
-        if n.get("cls") != "android.widget.Button":
-            continue
-        cd = (n.get("content_desc") or "").strip()
-        if "like" not in cd.lower():
-            continue
-        b = n.get("bounds")
-        if not b:
-            continue
-        cx, cy = _bounds_center(b)
-        if not (x1 <= cx <= x2 and y1 <= cy <= y2):
-            continue
-        score = (cx - mid_x) + (cy - mid_y)
-        if best_score is None or score > best_score:
-            best_score = score
-            best = b
-            best_desc = cd
-    if best:
-        return best, best_desc
-
-    # Fallback: nearest like button to bottom-right corner.
-    br_x, br_y = x2, y2
+    # Fallback (nearest like button to the bottom-right corner) is tracked in the same pass.
     fallback = None
     fallback_desc = ""
     fallback_dist = None
@@ -1095,11 +1227,19 @@ def _find_like_button_in_photo(
         if not b:
             continue
         cx, cy = _bounds_center(b)
-        dist = abs(cx - br_x) + abs(cy - br_y)
+        if x1 <= cx <= x2 and y1 <= cy <= y2:
+            score = (cx - mid_x) + (cy - mid_y)
+            if best_score is None or score > best_score:
+                best_score = score
+                best = b
+                best_desc = cd
+        dist = abs(cx - x2) + abs(cy - y2)
         if fallback_dist is None or dist < fallback_dist:
             fallback_dist = dist
             fallback = b
             fallback_desc = cd
+    if best:
+        return best, best_desc
     return fallback, fallback_desc
 
 
@@ -1313,13 +1453,10 @@ def _scroll_and_capture(
         distance_px,
         duration_ms=duration_ms or 450,
     )
-    time.sleep(0.5)
-    xml = _dump_ui_xml(device)
-    nodes = _parse_ui_nodes(xml)
-    current_scroll_area = _find_scroll_area(nodes) or scroll_area
+    nodes, current_scroll_area, prev_sig, curr_sig = _dump_nodes_after_gesture(
+        device, prev_nodes, scroll_area
+    )
     actual = _compute_scroll_delta(prev_nodes, nodes, current_scroll_area)
-    prev_sig = _screen_signature(prev_nodes, current_scroll_area)
-    curr_sig = _screen_signature(nodes, current_scroll_area)
     screen_changed = prev_sig != curr_sig
     overlap = 0.0
     if prev_sig:
@@ -1455,7 +1592,7 @@ def _seek_target_on_screen(
                     scroll_area,
                     int(target_hash),
                     expected_screen_y=expected_screen_y,
-                    max_dist=18,
+                    max_dist=_HASH_MATCH_MAX_DIST,
                     square_only=True,
                 )
                 if match_bounds:
@@ -1522,7 +1659,7 @@ def _seek_photo_by_index(
     target_index: int,
     target_hash: Optional[int] = None,
     max_steps: int = 25,
-    max_dist: int = 18,
+    max_dist: int = _HASH_MATCH_MAX_DIST,
 ) -> Dict[str, Any]:
     """
     Photo-only re-acquire by index: scroll from top and count square photos.
@@ -1553,14 +1690,14 @@ def _seek_photo_by_index(
             )
             scroll_area = _find_scroll_area(nodes) or scroll_area
             if photo_bounds and _is_square_bounds(photo_bounds):
-                h = _compute_center_ahash_from_bounds(
+                h = _compute_center_hash_from_bounds(
                     device, photo_bounds, width, height
                 )
-                dist = _ahash_distance(h, target_hash) if (h is not None and target_hash is not None) else None
+                dist = _hash_distance(h, target_hash) if (h is not None and target_hash is not None) else None
                 _log(f"[SEEK-PHOTO] candidate bounds={photo_bounds} dist={dist}")
                 is_new = True
                 if h is not None and last_hash is not None:
-                    if _ahash_distance(h, last_hash) <= 6:
+                    if _hash_distance(h, last_hash) <= _HASH_DUPLICATE_DIST:
                         is_new = False
                 if is_new:
                     count += 1
@@ -1621,7 +1758,7 @@ def _seek_photo_by_index_from_bottom(
     total_photos: int,
     target_hash: Optional[int] = None,
     max_steps: int = 25,
-    max_dist: int = 18,
+    max_dist: int = _HASH_MATCH_MAX_DIST,
 ) -> Dict[str, Any]:
     """
     Photo re-acquire by index starting from bottom (current screen).
@@ -1660,15 +1797,15 @@ def _seek_photo_by_index_from_bottom(
             )
             scroll_area = _find_scroll_area(nodes) or scroll_area
             if photo_bounds and _is_square_bounds(photo_bounds):
-                h = _compute_center_ahash_from_bounds(
+                h = _compute_center_hash_from_bounds(
                     device, photo_bounds, width, height
                 )
-                dist = _ahash_distance(h, target_hash) if (h is not None and target_hash is not None) else None
+                dist = _hash_distance(h, target_hash) if (h is not None and target_hash is not None) else None
                 _log(f"[SEEK-PHOTO] candidate bounds={photo_bounds} dist={dist}")
                 is_new = True
                 if h is not None:
                     for prev in seen_hashes:
-                        if _ahash_distance(h, prev) <= 6:
+                        if _hash_distance(h, prev) <= _HASH_DUPLICATE_DIST:
                             is_new = False
                             break
                 if is_new:
@@ -1742,15 +1879,14 @@ def _compute_desired_offset(
     return max(0, int(desired))
 
 
-def _capture_crop_from_device(
+def _grab_crop_from_device(
     device,
     bounds: Tuple[int, int, int, int],
-    out_name: str,
     width: int,
     height: int,
-) -> str:
+) -> Image.Image:
     """
-    Capture a full screencap and crop to bounds.
+    Capture a full screencap and crop to bounds (in memory).
     """
     x1, y1, x2, y2 = bounds
     x1 = max(0, min(width - 1, x1))
@@ -1760,15 +1896,26 @@ def _capture_crop_from_device(
     if x2 <= x1 or y2 <= y1:
         raise ValueError("Invalid crop bounds")
 
-    img_bytes = device.screencap()
-    img = Image.open(BytesIO(img_bytes)).convert("RGB")
-    crop = img.crop((x1, y1, x2, y2))
+    # Crop before converting so only the photo region is copied, not the full frame.
+    return _screencap_image(device).crop((x1, y1, x2, y2)).convert("RGB")
+
+
+_CROP_SEQ = itertools.count(1)
 
-    os.makedirs(os.path.join("images", "crops"), exist_ok=True)
-    ts = int(time.time() * 1000)
-    out_path = os.path.join("images", "crops", f"{ts}_{out_name}.png")
+
+def _crop_out_path(out_name: str) -> str:
+    crops_dir = os.path.join("images", "crops")
+    os.makedirs(crops_dir, exist_ok=True)
+    # Monotonic sequence keeps capture order in the filename without wall-clock reads.
+    return os.path.join(crops_dir, f"{next(_CROP_SEQ):04d}_{out_name}.png")
+
+
+def _save_crop_and_hash(crop: Image.Image, out_path: str) -> Optional[int]:
+    """
+    Write the crop to disk and return its center pHash. Runs off the scan thread.
+    """
     crop.save(out_path)
-    return out_path
+    return _compute_center_hash(crop)
 
 
 def _clear_crops_folder() -> None:
@@ -1776,15 +1923,15 @@ def _clear_crops_folder() -> None:
     if not os.path.isdir(crops_dir):
         return
     removed = 0
-    for name in os.listdir(crops_dir):
-        if not name.lower().endswith(".png"):
-            continue
-        path = os.path.join(crops_dir, name)
-        try:
-            os.remove(path)
-            removed += 1
-        except Exception as e:
-            _log(f"[PHOTO] failed to remove crop {path}: {e}")
+    with os.scandir(crops_dir) as entries:
+        for entry in entries:
+            if not entry.name.lower().endswith(".png"):
+                continue
+            try:
+                os.unlink(entry.path)
+                removed += 1
+            except Exception as e:
+                _log(f"[PHOTO] failed to remove crop {entry.path}: {e}")
     if removed:
         _log(f"[PHOTO] cleared {removed} crop files")
 
@@ -1859,142 +2006,149 @@ def _scan_profile_single_pass(
     did_hscroll = False
     no_move = 0
     scrolls = 0
-
-    while True:
-        # Extract biometrics visible on this screen.
-        updates = _extract_biometrics_from_nodes(nodes, scroll_area)
-        for k, v in updates.items():
-            if k not in biometrics and v not in ("", None):
-                biometrics[k] = v
-                _log(f"[BIOMETRICS] {k} = {v}")
-
-        # Horizontal biometrics scroll (once), stop when no new values appear.
-        if not did_hscroll and any(k in biometrics for k in ("Age", "Gender", "Sexuality")):
-            nodes = _scan_biometrics_hscroll(device, nodes, scroll_area, biometrics)
-            did_hscroll = True
-            skip_photo_capture_once = True
-
-        # Update prompts/polls/likes.
-        _update_ui_map_text_only(ui_map, nodes, scroll_area, offset)
-
-        # Capture primary photo if present and new.
-        photo_bounds = _find_primary_photo_bounds(nodes, scroll_area)
-        if photo_bounds:
-            if skip_photo_capture_once:
-                _log("[PHOTO] skip capture immediately after hscroll iteration")
-                skip_photo_capture_once = False
-            else:
-                # Micro-scroll if needed to get a full square photo.
-                nodes, offset, photo_bounds = _ensure_photo_square(
-                    device, width, height, scroll_area, nodes, offset, photo_bounds
-                )
-                scroll_area = _find_scroll_area(nodes) or scroll_area
-                ui_map["scroll_area"] = scroll_area
-                if photo_bounds:
-                    vb_w = photo_bounds[2] - photo_bounds[0]
-                    vb_h = photo_bounds[3] - photo_bounds[1]
-                    is_square = abs(vb_w - vb_h) <= 12
-                    if not is_square:
-                        _log(f"[PHOTO] skip non-square size={vb_w}x{vb_h}")
-                    else:
-                        abs_bounds = (
-                            photo_bounds[0],
-                            photo_bounds[1] + offset,
-                            photo_bounds[2],
-                            photo_bounds[3] + offset,
-                        )
-                        abs_top = abs_bounds[1]
-                        key = int(round(abs_top / 50.0)) * 50
-                        min_gap = int((last_capture_height or vb_h) * 0.6)
-                        if last_capture_abs_top is not None:
-                            gap = abs_top - last_capture_abs_top
-                            if gap <= 0 or gap < min_gap:
-                                _log(
-                                    f"[PHOTO] skip candidate abs_top={abs_top} gap={gap} min_gap={min_gap}"
-                                )
-                                photo_bounds = None
-                        if photo_bounds:
-                            if key in seen_photo_keys:
-                                _log(f"[PHOTO] skip duplicate abs_top={abs_top} key={key}")
-                            else:
-                                like_bounds, like_desc = _find_like_button_in_photo(nodes, photo_bounds)
-                                like_abs = None
-                                if like_bounds:
-                                    like_abs = (
-                                        like_bounds[0],
-                                        like_bounds[1] + offset,
-                                        like_bounds[2],
-                                        like_bounds[3] + offset,
-                                    )
-
-                                try:
-                                    crop_path = _capture_crop_from_device(
-                                        device,
-                                        photo_bounds,
-                                        f"photo_{len(ui_map['photos'])+1}",
-                                        width,
-                                        height,
+    pending_crops: List[Tuple[Dict[str, Any], Future]] = []
+    # The with block joins pending crop writes even if the scroll loop raises.
+    with ThreadPoolExecutor(max_workers=1) as crop_pool:
+        while True:
+            # Extract biometrics visible on this screen.
+            updates = _extract_biometrics_from_nodes(nodes, scroll_area)
+            for k, v in updates.items():
+                if k not in biometrics and v not in ("", None):
+                    biometrics[k] = v
+                    _log(f"[BIOMETRICS] {k} = {v}")
+
+            # Horizontal biometrics scroll (once), stop when no new values appear.
+            if not did_hscroll and any(k in biometrics for k in ("Age", "Gender", "Sexuality")):
+                nodes = _scan_biometrics_hscroll(device, nodes, scroll_area, biometrics)
+                did_hscroll = True
+                skip_photo_capture_once = True
+
+            # Update prompts/polls/likes.
+            _update_ui_map_text_only(ui_map, nodes, scroll_area, offset)
+
+            # Capture primary photo if present and new.
+            photo_bounds = _find_primary_photo_bounds(nodes, scroll_area)
+            if photo_bounds:
+                if skip_photo_capture_once:
+                    _log("[PHOTO] skip capture immediately after hscroll iteration")
+                    skip_photo_capture_once = False
+                else:
+                    # Micro-scroll if needed to get a full square photo.
+                    nodes, offset, photo_bounds = _ensure_photo_square(
+                        device, width, height, scroll_area, nodes, offset, photo_bounds
+                    )
+                    scroll_area = _find_scroll_area(nodes) or scroll_area
+                    ui_map["scroll_area"] = scroll_area
+                    if photo_bounds:
+                        vb_w = photo_bounds[2] - photo_bounds[0]
+                        vb_h = photo_bounds[3] - photo_bounds[1]
+                        is_square = abs(vb_w - vb_h) <= 12
+                        if not is_square:
+                            _log(f"[PHOTO] skip non-square size={vb_w}x{vb_h}")
+                        else:
+                            abs_bounds = (
+                                photo_bounds[0],
+                                photo_bounds[1] + offset,
+                                photo_bounds[2],
+                                photo_bounds[3] + offset,
+                            )
+                            abs_top = abs_bounds[1]
+                            key = int(round(abs_top / 50.0)) * 50
+                            min_gap = int((last_capture_height or vb_h) * 0.6)
+                            if last_capture_abs_top is not None:
+                                gap = abs_top - last_capture_abs_top
+                                if gap <= 0 or gap < min_gap:
+                                    _log(
+                                        f"[PHOTO] skip candidate abs_top={abs_top} gap={gap} min_gap={min_gap}"
                                     )
-                                    photo_paths.append(crop_path)
-                                except Exception as e:
-                                    _log(f"[PHOTO] capture failed: {e}")
-                                    crop_path = ""
-
-                                photo_hash = (
-                                    _compute_center_ahash_from_file(crop_path) if crop_path else None
-                                )
-                                like_center = _bounds_center(like_abs) if like_abs else None
-                                ui_map["photos"].append(
-                                    {
+                                    photo_bounds = None
+                            if photo_bounds:
+                                if key in seen_photo_keys:
+                                    _log(f"[PHOTO] skip duplicate abs_top={abs_top} key={key}")
+                                else:
+                                    like_bounds, like_desc = _find_like_button_in_photo(nodes, photo_bounds)
+                                    like_abs = None
+                                    if like_bounds:
+                                        like_abs = (
+                                            like_bounds[0],
+                                            like_bounds[1] + offset,
+                                            like_bounds[2],
+                                            like_bounds[3] + offset,
+                                        )
+
+                                    save_future: Optional[Future] = None
+                                    try:
+                                        crop = _grab_crop_from_device(device, photo_bounds, width, height)
+                                        crop_path = _crop_out_path(f"photo_{len(ui_map['photos'])+1}")
+                                        # Encode + hash while the next swipe/dump runs.
+                                        save_future = crop_pool.submit(_save_crop_and_hash, crop, crop_path)
+                                        photo_paths.append(crop_path)
+                                    except Exception as e:
+                                        _log(f"[PHOTO] capture failed: {e}")
+                                        crop_path = ""
+
+                                    like_center = _bounds_center(like_abs) if like_abs else None
+                                    photo_entry = {
                                         "content_desc": "photo",
                                         "abs_bounds": abs_bounds,
                                         "abs_center_y": int((abs_bounds[1] + abs_bounds[3]) / 2),
                                         "like_bounds": like_abs,
                                         "like_desc": like_desc,
                                         "crop_path": crop_path,
-                                        "hash": photo_hash,
+                                        "hash": None,
                                         "abs_top": abs_top,
                                         "like_center": like_center,
                                     }
-                                )
-                                seen_photo_keys.add(key)
-                                last_capture_abs_top = abs_top
-                                last_capture_height = vb_h
-                                _log(
-                                    f"[PHOTO] captured abs_top={abs_top} abs_bounds={abs_bounds} "
-                                    f"like_abs={like_abs} like_center={like_center}"
-                                )
-        elif skip_photo_capture_once:
-            # Ensure we only skip once even if no photo was visible.
-            skip_photo_capture_once = False
+                                    ui_map["photos"].append(photo_entry)
+                                    if save_future is not None:
+                                        pending_crops.append((photo_entry, save_future))
+                                    seen_photo_keys.add(key)
+                                    last_capture_abs_top = abs_top
+                                    last_capture_height = vb_h
+                                    _log(
+                                        f"[PHOTO] captured abs_top={abs_top} abs_bounds={abs_bounds} "
+                                        f"like_abs={like_abs} like_center={like_center}"
+                                    )
+            elif skip_photo_capture_once:
+                # Ensure we only skip once even if no photo was visible.
+                skip_photo_capture_once = False
 
-        # Scroll down for next screen.
-        if scrolls >= max_scrolls:
-            _log("[SCROLL] max_scrolls reached; stopping.")
-            break
-        prev_nodes = nodes
-        nodes, delta = _scroll_and_capture(
-            device,
-            width,
-            height,
-            scroll_area,
-            "down",
-            prev_nodes,
-            distance_px=scroll_step_px,
-        )
-        scroll_area = _find_scroll_area(nodes) or scroll_area
-        ui_map["scroll_area"] = scroll_area
-        offset += delta
-        ui_map["scroll_history"].append(delta)
-        scrolls += 1
+            # Scroll down for next screen.
+            if scrolls >= max_scrolls:
+                _log("[SCROLL] max_scrolls reached; stopping.")
+                break
+            prev_nodes = nodes
+            nodes, delta = _scroll_and_capture(
+                device,
+                width,
+                height,
+                scroll_area,
+                "down",
+                prev_nodes,
+                distance_px=scroll_step_px,
+            )
+            scroll_area = _find_scroll_area(nodes) or scroll_area
+            ui_map["scroll_area"] = scroll_area
+            offset += delta
+            ui_map["scroll_history"].append(delta)
+            scrolls += 1
 
-        if abs(delta) <= 5:
-            no_move += 1
-        else:
-            no_move = 0
-        if no_move >= 2:
-            _log("[SCROLL] No movement detected twice; likely bottom reached.")
-            break
+            if abs(delta) <= 5:
+                no_move += 1
+            else:
+                no_move = 0
+            if no_move >= 2:
+                _log("[SCROLL] No movement detected twice; likely bottom reached.")
+                break
+
+    for photo_entry, save_future in pending_crops:
+        try:
+            photo_entry["hash"] = save_future.result()
+        except Exception as e:
+            _log(f"[PHOTO] capture failed: {e}")
+            if photo_entry["crop_path"] in photo_paths:
+                photo_paths.remove(photo_entry["crop_path"])
+            photo_entry["crop_path"] = ""
 
     _assign_like_buttons(ui_map)
     _assign_ids(ui_map)